@@ -1,8 +1,11 @@
 import os
 import json
 import random
+import time
+import hashlib
+import mimetypes
 from datetime import datetime, timezone
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, make_response, send_from_directory, abort
 from supabase import create_client
 from dotenv import load_dotenv
 import google.generativeai as genai
@@ -33,6 +36,86 @@ app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-product
 ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'admin')
 ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD', 'admin123')
 
+# Fingerprinted, precompressed assets produced by build_assets.py
+STATIC_DIST_DIR = os.path.join(app.static_folder, 'dist')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Rendered HTML is cached in-process and at the Vercel edge (s-maxage), so most
+# page loads never reach the Python function. Every warm instance holds its own
+# copy, so entries expire after PAGE_CACHE_TTL seconds rather than relying on
+# invalidation alone.
+PAGE_CACHE = {}
+PAGE_CACHE_TTL = 60
+PAGE_CACHE_CONTROL = 'public, max-age=0, s-maxage=300, stale-while-revalidate=60'
+
+
+def asset_fingerprint(name, content):
+    """Return the hashed file name for an asset (must match build_assets.fingerprint)."""
+    digest = hashlib.sha256(content).hexdigest()[:8]
+    base, ext = os.path.splitext(name)
+    return f"{base}.{digest}{ext}"
+
+def load_asset_manifest():
+    """Load the original -> fingerprinted asset name mapping, if assets were built.
+
+    Entries whose source file changed since the last build are dropped, so an
+    edited asset is served from /static/<name> until build_assets.py is re-run.
+    """
+    try:
+        with open(os.path.join(STATIC_DIST_DIR, 'manifest.json')) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    current = {}
+    for name, hashed_name in manifest.items():
+        try:
+            with open(os.path.join(app.static_folder, name), 'rb') as f:
+                content = f.read()
+        except OSError:
+            continue
+        if asset_fingerprint(name, content) == hashed_name:
+            current[name] = hashed_name
+        else:
+            print(f"Static asset {name} changed since last build, run build_assets.py")
+    return current
+
+ASSET_MANIFEST = load_asset_manifest()
+
+@app.context_processor
+def inject_asset_url():
+    def asset_url(name):
+        hashed_name = ASSET_MANIFEST.get(name)
+        if hashed_name:
+            return url_for('static_dist', filename=hashed_name)
+        return url_for('static', filename=name)
+    return {'asset_url': asset_url}
+
+# Page cache helpers
+def cached_page(key, render):
+    """Serve rendered HTML from the page cache with an ETag, re-rendering it once stale.
+
+    render() returns the HTML, or None if the page does not exist (not cached).
+    """
+    page = PAGE_CACHE.get(key)
+    if page is None or time.monotonic() - page[2] > PAGE_CACHE_TTL:
+        PAGE_CACHE.pop(key, None)
+        html = render()
+        if html is None:
+            return None
+        page = (html, hashlib.sha256(html.encode('utf-8')).hexdigest()[:16], time.monotonic())
+        PAGE_CACHE[key] = page
+
+    html, etag, _ = page
+    response = make_response(html)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = PAGE_CACHE_CONTROL
+    return response.make_conditional(request)
+
+def invalidate_course_page(course_id):
+    """Drop this instance's cached landing page of a course after it is created, edited or deleted."""
+    PAGE_CACHE.pop(('course_quiz', course_id.lower()), None)
+
 
 # Admin authentication decorator
 def admin_required(f):
@@ -165,19 +248,46 @@ def evaluate_answer_gemini(user_answer, question, knowledge_text):
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    return cached_page(('index',), lambda: render_template('index.html'))
 
 @app.route('/info')
 def course_info():
-    return render_template('course_info.html')
+    return cached_page(('course_info',), lambda: render_template('course_info.html'))
 
 @app.route('/course/<course_id>')
 def course_quiz(course_id):
     """Render quiz page for a specific course"""
-    course_data = load_course_data(course_id)
-    if not course_data:
+    course_id = course_id.lower()
+
+    def render_course_page():
+        course_data = load_course_data(course_id)
+        if not course_data:
+            return None
+        return render_template('index.html', course_id=course_id, course_title=course_data.get('title', course_id.upper()))
+
+    response = cached_page(('course_quiz', course_id), render_course_page)
+    if response is None:
         return f"Course {course_id.upper()} not found", 404
-    return render_template('index.html', course_id=course_id, course_title=course_data.get('title', course_id.upper()))
+    return response
+
+@app.route('/static/dist/<path:filename>')
+def static_dist(filename):
+    """Serve a fingerprinted asset, preferring a precompressed variant"""
+    # The .br/.gz files are only served through negotiation below
+    if filename.endswith(('.br', '.gz')):
+        abort(404)
+
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+        if request.accept_encodings[encoding] > 0 and os.path.isfile(os.path.join(STATIC_DIST_DIR, filename + suffix)):
+            response = send_from_directory(STATIC_DIST_DIR, filename + suffix, mimetype=mimetype)
+            response.headers['Content-Encoding'] = encoding
+            break
+    else:
+        response = send_from_directory(STATIC_DIST_DIR, filename, mimetype=mimetype)
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 # Admin routes
 @app.route('/admin')
@@ -267,6 +377,7 @@ def admin_new_course():
         
         try:
             res = supabase.table('courses').insert(course_data).execute()
+            invalidate_course_page(course_id)
             flash(f'Course {course_id} created successfully!', 'success')
             return redirect(url_for('admin_dashboard'))
         
@@ -324,6 +435,7 @@ def admin_edit_course(course_id):
         
         try:
             res = supabase.table('courses').update(update_data).eq('id', course_id).execute()
+            invalidate_course_page(course_id)
             flash(f'Course {course_id} updated successfully!', 'success')
             return redirect(url_for('admin_dashboard'))
         
@@ -341,6 +453,7 @@ def admin_delete_course(course_id):
     """Delete a course from Supabase"""
     try:
         res = supabase.table('courses').delete().eq('id', course_id).execute()
+        invalidate_course_page(course_id)
         if res.data:
             flash(f'Course {course_id} deleted successfully!', 'success')
         else:
@@ -0,0 +1,93 @@
+"""Fingerprint and precompress the static assets served by the quiz app.
+
+Run this before deploying whenever api/static/app.js or styles.css change:
+
+    pip install -r requirements-build.txt
+    python build_assets.py
+
+Each asset is copied to api/static/dist/ with a content hash in its name
+(e.g. app.3f9c2a1b.js) next to .gz and .br precompressed variants, and a
+manifest.json mapping the original names to the fingerprinted ones is
+written for api/index.py to pick up. api/index.py ignores manifest entries
+whose source file no longer matches its hash.
+
+On Vercel the dist/ files are served by the static builder, which does not
+negotiate the .br/.gz variants (the edge compresses on its own); those are
+only used by the Flask fallback route, e.g. when running locally.
+"""
+import os
+import json
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api', 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+ASSETS = ['app.js', 'styles.css']
+
+
+def fingerprint(name, content):
+    """Return the hashed file name for an asset, e.g. app.js -> app.3f9c2a1b.js"""
+    digest = hashlib.sha256(content).hexdigest()[:8]
+    base, ext = os.path.splitext(name)
+    return f"{base}.{digest}{ext}"
+
+
+def write_file(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+def remove_previous_build():
+    """Delete the hashed files listed in the previous manifest, and their variants."""
+    try:
+        with open(MANIFEST_PATH) as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    for hashed_name in previous.values():
+        for suffix in ('', '.gz', '.br'):
+            path = os.path.join(DIST_DIR, hashed_name + suffix)
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+def build():
+    if brotli is None:
+        raise SystemExit("brotli is required to build assets: pip install -r requirements-build.txt")
+
+    os.makedirs(DIST_DIR, exist_ok=True)
+
+    # Drop outputs from the previous build so stale hashes don't pile up
+    remove_previous_build()
+
+    manifest = {}
+    for name in ASSETS:
+        with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+            content = f.read()
+
+        hashed_name = fingerprint(name, content)
+        hashed_path = os.path.join(DIST_DIR, hashed_name)
+        write_file(hashed_path, content)
+        # mtime=0 keeps the gzip output byte-identical across builds
+        write_file(hashed_path + '.gz', gzip.compress(content, compresslevel=9, mtime=0))
+        write_file(hashed_path + '.br', brotli.compress(content, quality=11))
+
+        manifest[name] = hashed_name
+        print(f"✓ {name} -> dist/{hashed_name}")
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    return manifest
+
+
+if __name__ == '__main__':
+    build()
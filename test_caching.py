@@ -0,0 +1,122 @@
+import os
+import sys
+import json
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'api'))
+
+# Stub the external services so the Flask app can be imported without credentials
+os.environ.setdefault('GEMINI_API_KEY', 'test')
+os.environ.setdefault('SUPABASE_URL', 'test')
+os.environ.setdefault('SUPABASE_KEY', 'test')
+for name in ('supabase', 'dotenv', 'google', 'google.generativeai'):
+    sys.modules.setdefault(name, types.ModuleType(name))
+sys.modules['supabase'].create_client = lambda *args: None
+sys.modules['dotenv'].load_dotenv = lambda *args, **kwargs: None
+sys.modules['google.generativeai'].configure = lambda **kwargs: None
+sys.modules['google'].generativeai = sys.modules['google.generativeai']
+
+import index
+import build_assets
+
+
+@pytest.fixture
+def client(monkeypatch):
+    index.PAGE_CACHE.clear()
+    lookups = []
+
+    def fake_load_course_data(course_id):
+        lookups.append(course_id)
+        if course_id.lower() == 'a101':
+            return {'title': 'A101'}
+        return None
+
+    monkeypatch.setattr(index, 'load_course_data', fake_load_course_data)
+    client = index.app.test_client()
+    client.lookups = lookups
+    return client
+
+
+def test_page_etag_and_304(client):
+    res = client.get('/')
+    assert res.status_code == 200
+    assert res.headers['Cache-Control'] == index.PAGE_CACHE_CONTROL
+    etag = res.headers['ETag']
+
+    res = client.get('/', headers={'If-None-Match': etag})
+    assert res.status_code == 304
+
+
+def test_course_page_cache_key_is_case_insensitive(client):
+    assert client.get('/course/a101').status_code == 200
+    assert client.get('/course/A101').status_code == 200
+    assert client.lookups == ['a101']
+    assert list(index.PAGE_CACHE) == [('course_quiz', 'a101')]
+
+
+def test_missing_course_is_not_cached(client):
+    assert client.get('/course/nope').status_code == 404
+    assert client.get('/course/nope').status_code == 404
+    assert client.lookups == ['nope', 'nope']
+    assert index.PAGE_CACHE == {}
+
+
+def test_invalidate_course_page(client):
+    client.get('/course/a101')
+    index.invalidate_course_page('A101')
+    client.get('/course/a101')
+    assert client.lookups == ['a101', 'a101']
+
+
+def test_cached_page_expires(client, monkeypatch):
+    client.get('/course/a101')
+    monkeypatch.setattr(index, 'PAGE_CACHE_TTL', -1)
+    client.get('/course/a101')
+    assert client.lookups == ['a101', 'a101']
+
+
+@pytest.mark.parametrize('accept, encoding', [
+    ('br, gzip', 'br'),
+    ('br;q=0, gzip', 'gzip'),
+    ('gzip', 'gzip'),
+    ('identity', None),
+    ('br;q=0, gzip;q=0', None),
+])
+def test_static_dist_encoding_negotiation(client, accept, encoding):
+    hashed_name = index.ASSET_MANIFEST['app.js']
+    res = client.get(f'/static/dist/{hashed_name}', headers={'Accept-Encoding': accept})
+    assert res.status_code == 200
+    assert res.headers.get('Content-Encoding') == encoding
+    assert res.mimetype == 'text/javascript'
+    assert res.headers['Cache-Control'] == index.IMMUTABLE_CACHE_CONTROL
+    res.close()
+
+
+def test_static_dist_rejects_compressed_variants(client):
+    hashed_name = index.ASSET_MANIFEST['app.js']
+    assert client.get(f'/static/dist/{hashed_name}.gz').status_code == 404
+    assert client.get(f'/static/dist/{hashed_name}.br').status_code == 404
+
+
+def test_dist_matches_sources():
+    """Fails when app.js/styles.css were edited without re-running build_assets.py"""
+    with open(build_assets.MANIFEST_PATH) as f:
+        manifest = json.load(f)
+    for name in build_assets.ASSETS:
+        with open(os.path.join(build_assets.STATIC_DIR, name), 'rb') as f:
+            content = f.read()
+        assert manifest[name] == build_assets.fingerprint(name, content)
+        assert index.asset_fingerprint(name, content) == manifest[name]
+
+
+def test_manifest_ignores_stale_entries(client, monkeypatch, tmp_path):
+    (tmp_path / 'manifest.json').write_text(json.dumps({'app.js': 'app.00000000.js'}))
+    monkeypatch.setattr(index, 'STATIC_DIST_DIR', str(tmp_path))
+    monkeypatch.setattr(index, 'ASSET_MANIFEST', index.load_asset_manifest())
+    assert index.ASSET_MANIFEST == {}
+
+    res = client.get('/')
+    assert b'src="/static/app.js"' in res.data
+    assert b'href="/static/styles.css"' in res.data